@@ -4,25 +4,80 @@ import pygame
 import pygame_gui
 import time
 import os
+import threading
+from functools import partial
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # Numba is optional — without it the sequential fallback runs as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
+    prange = range
+
+
+# ========== Block Rules ==========
+@njit(cache=True, nogil=True)
+def step_block_row(grid, N, start, i, i1):
+    # Applies the rules, left to right, to the 2x2 blocks covering rows i and i1 from column start,
+    # wrapping around the right edge
+    for j in range(start, N, 2):
+        j1 = j + 1 if j + 1 < N else 0
+        a, b = grid[i, j], grid[i, j1]
+        c, d = grid[i1, j], grid[i1, j1]
+        density = a + b + c + d
 
-# ========== Cell and Board Classes ==========
-class Cell:
-    def __init__(self, p):
-        # Initializes the cell state randomly: 1 (alive) with probability p
-        self.state = np.random.choice([0, 1], p=[1 - p, p])
-
-    def flip(self):
-        # Inverts the cell's state (0 -> 1, 1 -> 0)
-        self.state ^= 1
-
-
+        if density == 2:
+            continue # Stable block — no changes
+        elif density == 3:
+            # Flip and rotate 180 degrees
+            grid[i, j], grid[i1, j1] = d ^ 1, a ^ 1
+            grid[i, j1], grid[i1, j] = c ^ 1, b ^ 1
+        else:
+            # Full flip
+            grid[i, j], grid[i, j1] = a ^ 1, b ^ 1
+            grid[i1, j], grid[i1, j1] = c ^ 1, d ^ 1
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def step_phase(grid, N, start):
+    # Applies the rules to the 2x2 blocks starting at (start, start), wrapping around the board edges.
+    # Block rows that stay within the board are disjoint and run in parallel; a last row that wraps
+    # onto row 0 overlaps the first one, so it runs afterwards
+    for k in prange((N - start) // 2):
+        i = start + 2 * k
+        step_block_row(grid, N, start, i, i + 1)
+    if (N - start) % 2 == 1:
+        step_block_row(grid, N, start, N - 1, 0)
+
+
+def block_transition_table():
+    # Returns the new state of every 2x2 block pattern, packed as 4-bit words abcd
+    # (a = top-left, b = top-right, c = bottom-left, d = bottom-right)
+    table = np.zeros(16, dtype=np.uint8)
+    for pattern in range(16):
+        a, b, c, d = (pattern >> 3) & 1, (pattern >> 2) & 1, (pattern >> 1) & 1, pattern & 1
+        density = a + b + c + d
+        if density == 3:
+            a, b, c, d = d, c, b, a # Rotate 180 degrees
+        if density != 2:
+            a, b, c, d = a ^ 1, b ^ 1, c ^ 1, d ^ 1 # Flip
+        table[pattern] = (a << 3) | (b << 2) | (c << 1) | d
+    return table
+
+
+# ========== Board Class ==========
 class Board:
+    TILE = 256 # Edge length, in cells, of the tiles processed by the vectorized step
+    TRANSITION = block_transition_table()
+    WORD = np.dtype("<u8") # Bit-plane word; little-endian so bit k of byte j is column 8j + k
+
     def __init__(self, N, p, wraparound=True, glider=None, init_mode="Random"):
         self.N = N
         self.wraparound = wraparound
-        self.blocks_even = self._create_blocks(start=1)
-        self.blocks_odd = self._create_blocks(start=0) 
-        self.grid = np.array([[Cell(p) for _ in range(N)] for _ in range(N)])
+        # Cell states: 1 (alive) with probability p, drawn in one call. The array is private:
+        # it can lag behind the packed state, so it is read through get_state_array
+        self._grid = (np.random.random((N, N)) < p).view(np.uint8)
 
         # Choose initialization mode
         if glider is not None:
@@ -32,23 +87,26 @@ class Board:
         elif init_mode == "Odd Diagonals Alive":
             self._initialize_diagonal_pattern()
 
+        # Even-sized boards are stepped as packed bit planes; self._grid is then only
+        # refreshed from them when the state is read
+        self._grid_stale = False
+        if N % 2 == 0:
+            self._load_planes()
+
+        # The update of each phase depends only on N and wraparound, so it is chosen once here,
+        # together with the block views it works on
+        self._step_even = self._phase_step(start=1)
+        self._step_odd = self._phase_step(start=0)
+
     def _initialize_odd_columns(self):
         # Activates all cells in odd-indexed columns
-        for i in range(self.N):
-            for j in range(self.N):
-                if j % 2 == 1:
-                    self.grid[i][j].state = 1
-                else:
-                    self.grid[i][j].state = 0
+        self._grid[:] = 0
+        self._grid[:, 1::2] = 1
 
     def _initialize_diagonal_pattern(self):
         # Activates cells where (i + j) is odd — creates a checkerboard-like pattern
-        for i in range(self.N):
-            for j in range(self.N):
-                if (i + j) % 2 == 1:
-                    self.grid[i][j].state = 1
-                else:
-                    self.grid[i][j].state = 0
+        i, j = np.ogrid[:self.N, :self.N]
+        self._grid[:] = (i + j) & 1
 
     def _place_pattern(self, pattern):
         # Places a glider at a random odd-aligned position
@@ -61,55 +119,156 @@ class Board:
         for i, row in enumerate(pattern):
             for j, val in enumerate(row):
                 if 0 <= top + i < self.N and 0 <= left + j < self.N:
-                    self.grid[top + i][left + j].state = val
-
-    def _create_blocks(self, start):
-        # Returns the top-left coordinates of all 2x2 blocks for even/odd generations
-        coords = []
-        for i in range(start, self.N, 2):
-            for j in range(start, self.N, 2):
-                if self.wraparound or (i + 1 < self.N and j + 1 < self.N):
-                    coords.append((i, j))
-        return coords
-
-    def apply_block_rules(self, i, j):
-        # Applies rules to a single 2x2 block at position (i, j)
+                    self._grid[top + i, left + j] = val
+
+    def _apply_tile_rules(self, A, B, C, D):
+        # Applies the block rules in place to every block of a tile at once, by looking up
+        # each block's packed pattern in the transition table
+        new = self.TRANSITION[(A << 3) | (B << 2) | (C << 1) | D]
+        A[...] = new >> 3
+        B[...] = (new >> 2) & 1
+        C[...] = (new >> 1) & 1
+        D[...] = new & 1
+
+    def _pack_plane(self, cells):
+        # Packs an (R, R) array of cells into rows of bit-plane words, column c in bit c % 64 of word c // 64
+        R = cells.shape[1]
+        packed = np.zeros((cells.shape[0], (R + 63) // 64 * 8), dtype=np.uint8)
+        packed[:, :(R + 7) // 8] = np.packbits(cells, axis=1, bitorder="little")
+        return packed.view(self.WORD)
+
+    def _load_planes(self):
+        # Packs the board into four bit planes, one per parity class: plane [p, q] holds the cells
+        # (p + 2r, q + 2c), i.e. the top-left, top-right, bottom-left and bottom-right corners of
+        # the blocks starting at (0, 0)
+        R = self.N // 2
+        self._planes = np.stack([self._pack_plane(self._grid[p::2, q::2]) for p in (0, 1) for q in (0, 1)])
+        self._planes = self._planes.reshape(2, 2, *self._planes.shape[1:])
+
+        # Masks of the blocks each phase updates (without wraparound the blocks starting at
+        # (1, 1) skip the last row/column, which would cross the edge)
+        active = np.ones((R, R), dtype=np.uint8)
+        self._active_aligned = self._pack_plane(active)
+        if not self.wraparound:
+            active[-1, :] = 0
+            active[:, -1] = 0
+        self._active_offset = self._pack_plane(active)
+        self._last_word = self._active_aligned[0, -1] # Valid bits of the last word of a row
+        self._last_bit = np.uint64((R - 1) % 64) # Position of column R - 1 in that word
+
+    def _unpack_planes(self):
+        # Writes the bit planes back into self._grid
+        R = self.N // 2
+        for p in (0, 1):
+            for q in (0, 1):
+                self._grid[p::2, q::2] = np.unpackbits(self._planes[p, q].view(np.uint8), axis=1,
+                                                      count=R, bitorder="little")
+
+    def _shift_left(self, plane):
+        # Returns the plane with column c + 1 (wrapping around) moved into column c
+        one = np.uint64(1)
+        shifted = plane >> one
+        shifted[:, :-1] |= plane[:, 1:] << np.uint64(63)
+        shifted[:, -1] |= (plane[:, 0] & one) << self._last_bit
+        return shifted
+
+    def _shift_right(self, plane):
+        # Returns the plane with column c - 1 (wrapping around) moved into column c
+        one = np.uint64(1)
+        shifted = plane << one
+        shifted[:, 1:] |= plane[:, :-1] >> np.uint64(63)
+        shifted[:, 0] |= (plane[:, -1] >> self._last_bit) & one
+        shifted[:, -1] &= self._last_word
+        return shifted
+
+    @staticmethod
+    def _apply_packed_rules(a, b, c, d, active):
+        # Applies the block rules to 64 blocks per word: a, b, c, d hold the top-left, top-right,
+        # bottom-left and bottom-right cells of each block. Returns the new a, b, c, d
+        x1, x2 = a ^ b, c ^ d
+        ones = x1 ^ x2 # Bit 0 of the density
+        twos = (a & b) ^ (c & d) ^ (x1 & x2) # Bit 1 of the density (2 or 3)
+        rotate = ones & twos & active # Density 3: flip and rotate 180 degrees
+        change = (ones | ~twos) & active # Every block except the stable ones flips
+        swap_ad, swap_bc = (a ^ d) & rotate, (b ^ c) & rotate
+        return a ^ swap_ad ^ change, b ^ swap_bc ^ change, c ^ swap_bc ^ change, d ^ swap_ad ^ change
+
+    def _step_packed_aligned(self):
+        # Applies the rules to the blocks starting at (0, 0), whose corners are the planes themselves
+        P = self._planes
+        P[0, 0], P[0, 1], P[1, 0], P[1, 1] = self._apply_packed_rules(P[0, 0], P[0, 1], P[1, 0], P[1, 1],
+                                                                      self._active_aligned)
+        self._grid_stale = True
+
+    def _step_packed_offset(self):
+        # Applies the rules to the blocks starting at (1, 1): their top-right, bottom-left and
+        # bottom-right corners lie one column, one row, or both further on in the other planes
+        P = self._planes
+        a, b, c, d = self._apply_packed_rules(P[1, 1], self._shift_left(P[1, 0]),
+                                              np.roll(P[0, 1], -1, axis=0),
+                                              np.roll(self._shift_left(P[0, 0]), -1, axis=0),
+                                              self._active_offset)
+        P[1, 1] = a
+        P[1, 0] = self._shift_right(b)
+        P[0, 1] = np.roll(c, 1, axis=0)
+        P[0, 0] = self._shift_right(np.roll(d, 1, axis=0))
+        self._grid_stale = True
+
+    def _block_tiles(self, start):
+        # Returns zero-copy views (A, B, C, D) of the top-left, top-right, bottom-left and bottom-right
+        # cells of the blocks starting at (start, start) that lie within the board, split into
+        # TILE x TILE tiles so the temporaries of each tile stay in cache
+        g, N = self._grid, self.N
+        corners = (g[start:N - 1:2, start:N - 1:2], g[start:N - 1:2, start + 1:N:2],
+                   g[start + 1:N:2, start:N - 1:2], g[start + 1:N:2, start + 1:N:2])
+        t = self.TILE // 2
+        rows, cols = corners[0].shape
+        return [tuple(view[ti:ti + t, tj:tj + t] for view in corners)
+                for ti in range(0, rows, t) for tj in range(0, cols, t)]
+
+    def _step_blocks(self, tiles):
+        # Applies the rules to every block of the given tiles
+        for A, B, C, D in tiles:
+            self._apply_tile_rules(A, B, C, D)
+
+    def _phase_step(self, start):
+        # Returns the update for the phase whose blocks start at (start, start)
         N = self.N
-        if not self.wraparound and (i + 1 >= N or j + 1 >= N):
-            return
-
-        indices = [
-            (i, j), (i, (j + 1) % N),
-            ((i + 1) % N, j), ((i + 1) % N, (j + 1) % N)
-        ]
-        cells = [self.grid[x][y] for x, y in indices]
-        density = sum(cell.state for cell in cells)
-
-        if density == 2:
-            return # Stable block — no changes
-        elif density in [0, 1, 4]:
-            for cell in cells:
-                cell.flip() # Full flip
-        elif density == 3: 
-            # Flip and rotate 180 degrees
-            self.grid[i][j], self.grid[(i + 1) % N][(j + 1) % N] = self.grid[(i + 1) % N][(j + 1) % N], self.grid[i][j]
-            self.grid[i][(j + 1) % N], self.grid[(i + 1) % N][j] = self.grid[(i + 1) % N][j], self.grid[i][(j + 1) % N]
-            for cell in cells:
-                cell.flip()
+        if N % 2 == 0:
+            return self._step_packed_offset if start == 1 else self._step_packed_aligned
+        if not (start == 0 and self.wraparound):
+            # Blocks crossing the edge (if any) are skipped
+            return partial(self._step_blocks, self._block_tiles(start))
+        # On an odd-sized wrapping board the last blocks overlap the first ones,
+        # so they have to be applied one at a time
+        return partial(step_phase, self._grid, N, start)
 
     def step(self, even):
         # Applies rules for the current generation
-        blocks = self.blocks_even if even else self.blocks_odd
-        for i, j in blocks:
-            self.apply_block_rules(i, j)
+        if even:
+            self._step_even()
+        else:
+            self._step_odd()
+
+    @property
+    def grid(self):
+        # The board as a read-only 2D numpy array of states (same as get_state_array)
+        return self.get_state_array()
 
     def get_state_array(self):
-        # Returns the board as a 2D numpy array of states
-        return np.array([[cell.state for cell in row] for row in self.grid])
+        # Returns the board as a 2D numpy array of states — a read-only view, not a copy
+        if self._grid_stale:
+            self._unpack_planes()
+            self._grid_stale = False
+        state = self._grid.view()
+        state.flags.writeable = False
+        return state
 
 
 # ========== Game Management ==========
 class GameManager:
+    PALETTE = np.array([[255, 255, 255], [0, 0, 0]], dtype=np.uint8) # RGB colour of each cell state
+
     def __init__(self, N=100, p=0.5, max_steps=250, wraparound=True, glider=None, init_mode="Random"):
         self.N = N
         self.p = p
@@ -118,27 +277,33 @@ class GameManager:
         self.board = Board(N, p, wraparound=wraparound, glider=glider, init_mode=init_mode)
         self.current_step = 0
 
+        # Board geometry is fixed for the whole simulation, so the one-pixel-per-cell and the
+        # scaled board surfaces are allocated once and redrawn in place
+        board_area_size = 560
+        self.cell_size = int(board_area_size // N)
+        self._cell_surface = pygame.surfarray.make_surface(np.zeros((N, N, 3), dtype=np.uint8))
+        self._board_surface = pygame.transform.scale(self._cell_surface, (N * self.cell_size, N * self.cell_size))
+
     def step(self):
         # Advances the game one generation
         even = (self.current_step % 2 == 0)
         self.board.step(even)
         self.current_step += 1
 
-    def draw(self, surface, offset_x):
-        # Draws the grid onto the GUI surface
-        board_area_size = 560
-        cell_size = int(board_area_size // self.N)
-        for i in range(self.N):
-            for j in range(self.N):
-                color = (0, 0, 0) if self.board.grid[i][j].state == 1 else (255, 255, 255)
-                x = int(offset_x + j * cell_size)
-                y = int(i * cell_size)
-                rect = pygame.Rect(x, y, cell_size, cell_size)
-                pygame.draw.rect(surface, color, rect)
+    def draw(self, surface, offset_x, grid=None):
+        # Draws the grid (by default the current board) onto the GUI surface as a single scaled image
+        if grid is None:
+            grid = self.board.get_state_array()
+        img = self.PALETTE[grid]
+        pygame.surfarray.blit_array(self._cell_surface, img.swapaxes(0, 1))
+        pygame.transform.scale(self._cell_surface, self._board_surface.get_size(), self._board_surface)
+        surface.blit(self._board_surface, (offset_x, 0))
 
 
 # ========== Simulator GUI Controller ==========
 class Simulator:
+    GENERATIONS_PER_SECOND = 5 # Pace of the compute thread; rendering runs at 60 FPS regardless
+
     def __init__(self):
         os.environ['SDL_AUDIODRIVER'] = 'dummy'
         pygame.init()
@@ -156,6 +321,12 @@ class Simulator:
         self.init_mode = "Random"
         self.glider = [[0,1], [1,0], [1,0], [0,1]] 
 
+        # Background stepping: the compute thread advances the board and the GUI loop
+        # snapshots whatever generation it has reached each frame
+        self._step_lock = threading.Lock()
+        self._unpaused = threading.Event()
+        self._stopped = threading.Event()
+
     def _build_gui(self):
         # Creates all GUI elements: sliders, buttons, dropdowns
         CONTROL_X = 10
@@ -285,43 +456,93 @@ class Simulator:
 
         self.run_simulation()
 
+    def _snapshot(self, shown):
+        # Returns (board, generation, grid copy) for the current board, or None if it is still the
+        # generation `shown`. Taken only when a frame is rendered, so stepping never pays for it
+        with self._step_lock:
+            board, generation = self.game_manager.board, self.game_manager.current_step
+            if (board, generation) == shown:
+                return None
+            return board, generation, board.get_state_array().copy()
+
+    def _compute_loop(self):
+        # Steps the board at GENERATIONS_PER_SECOND while unpaused and below max_steps, until stopped
+        interval = 1.0 / self.GENERATIONS_PER_SECOND
+        # Leave the initial board on screen for a full time slot before the first step
+        self._stopped.wait(timeout=interval)
+        while not self._stopped.is_set():
+            if not self._unpaused.wait(timeout=0.1):
+                continue
+            started = time.perf_counter()
+            with self._step_lock:
+                # Re-check the pause under the lock: Pause/Reset may have landed since the wait above
+                if self._unpaused.is_set() and self.game_manager.current_step < self.game_manager.max_steps:
+                    self.game_manager.step()
+            # Wait out the rest of this generation's time slot (stepping itself takes far less)
+            self._stopped.wait(timeout=max(0.0, interval - (time.perf_counter() - started)))
+
     def run_simulation(self):
         paused = False
         running = True
+        generation = 0
+
+        # Show the initial board (generation 0) before the compute thread can step it
+        board, generation, drawn_grid = self._snapshot(None)
+        shown = (board, generation)
+        self.game_manager.draw(self.screen, self.control_rect.width, drawn_grid)
+
+        self._stopped.clear()
+        self._unpaused.set()
+        compute_thread = threading.Thread(target=self._compute_loop, daemon=True)
+        compute_thread.start()
 
         while running:
-            time_delta = self.clock.tick(5) / 1000.0
+            time_delta = self.clock.tick(60) / 1000.0
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
+                    self._stopped.set()
                     pygame.quit()
                     exit()
                 elif event.type == pygame.USEREVENT and event.user_type == pygame_gui.UI_BUTTON_PRESSED:
                     if event.ui_element == self.controls["play_pause_button"]:
                         paused = not paused
+                        if paused:
+                            self._unpaused.clear()
+                        else:
+                            self._unpaused.set()
                         self.controls["play_pause_button"].set_text('Play' if paused else 'Pause')
                     elif event.ui_element == self.controls["reset_button"]:
                         paused = True
-                        self.game_manager.current_step = 0
-                        self.game_manager.board = Board(self.game_manager.N, self.game_manager.p, self.game_manager.wraparound,
-                                                         glider=self.glider if self.init_mode == "Glider" else None,
-                                                         init_mode=self.init_mode)
+                        self._unpaused.clear()
+                        with self._step_lock:
+                            self.game_manager.current_step = 0
+                            self.game_manager.board = Board(self.game_manager.N, self.game_manager.p, self.game_manager.wraparound,
+                                                             glider=self.glider if self.init_mode == "Glider" else None,
+                                                             init_mode=self.init_mode)
                         self.controls["play_pause_button"].set_text('Play')
                 self.manager.process_events(event)
 
-            if self.game_manager.current_step < self.game_manager.max_steps and not paused:
-                self.game_manager.step()
-                self.game_manager.draw(self.screen, self.control_rect.width)
-            elif self.game_manager.current_step < self.game_manager.max_steps and paused:
-                self.game_manager.draw(self.screen, self.control_rect.width)
-            else:
+            # Render the latest generation reached by the compute thread, unless it
+            # looks exactly like the board already on screen
+            snapshot = self._snapshot(shown)
+            if snapshot is not None:
+                board, generation, grid = snapshot
+                shown = (board, generation)
+                if drawn_grid is None or not np.array_equal(grid, drawn_grid):
+                    self.game_manager.draw(self.screen, self.control_rect.width, grid)
+                    drawn_grid = grid
+            if generation >= self.game_manager.max_steps:
                 running = False
 
             pygame.draw.rect(self.screen, (150, 150, 150), self.control_rect)
-            self.controls["generation_counter_label"].set_text(f"Generation: {self.game_manager.current_step}")
+            self.controls["generation_counter_label"].set_text(f"Generation: {generation}")
             self.manager.update(time_delta)
             self.manager.draw_ui(self.screen)
             pygame.display.update()
 
+        self._stopped.set()
+        compute_thread.join()
+
 
 # ========== Entry Point ==========
 if __name__ == "__main__":
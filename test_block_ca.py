@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from Block_CA import Board
+
+
+def reference_step(state, even, wraparound):
+    # Straightforward per-block version of the rules, in the original row-major order
+    N = state.shape[0]
+    grid = state.copy()
+    start = 1 if even else 0
+    for i in range(start, N, 2):
+        for j in range(start, N, 2):
+            if not wraparound and (i + 1 >= N or j + 1 >= N):
+                continue
+            i1, j1 = (i + 1) % N, (j + 1) % N
+            a, b, c, d = grid[i, j], grid[i, j1], grid[i1, j], grid[i1, j1]
+            density = int(a) + int(b) + int(c) + int(d)
+            if density == 3:
+                a, b, c, d = d, c, b, a # Rotate 180 degrees
+            if density != 2:
+                a, b, c, d = a ^ 1, b ^ 1, c ^ 1, d ^ 1 # Flip
+            grid[i, j], grid[i, j1], grid[i1, j], grid[i1, j1] = a, b, c, d
+    return grid
+
+
+# Even and odd sizes, including N / 2 a multiple of 64 (128, 256) and N / 2 > 64 spilling into a
+# second bit-plane word (130, 258)
+@pytest.mark.parametrize("N", [2, 3, 4, 5, 10, 11, 30, 128, 130, 131, 256, 258])
+@pytest.mark.parametrize("wraparound", [True, False])
+@pytest.mark.parametrize("init_mode", ["Random", "Odd Columns Alive", "Odd Diagonals Alive"])
+def test_step_matches_reference(N, wraparound, init_mode):
+    np.random.seed(N)
+    board = Board(N, 0.4, wraparound=wraparound, init_mode=init_mode)
+    expected = board.get_state_array().copy()
+    for generation in range(6):
+        even = generation % 2 == 0
+        board.step(even)
+        expected = reference_step(expected, even, wraparound)
+        assert np.array_equal(board.get_state_array(), expected), f"generation {generation + 1}"
+
+
+def test_glider_matches_reference():
+    np.random.seed(0)
+    board = Board(40, 1.0, glider=[[0, 1], [1, 0], [1, 0], [0, 1]])
+    expected = board.get_state_array().copy()
+    for generation in range(20):
+        even = generation % 2 == 0
+        board.step(even)
+        expected = reference_step(expected, even, True)
+    assert np.array_equal(board.get_state_array(), expected)
+
+
+def test_grid_is_read_only_and_current():
+    board = Board(10, 0.5)
+    board.step(True)
+    assert np.array_equal(board.grid, board.get_state_array())
+    with pytest.raises(ValueError):
+        board.grid[:] = 0
+